@@ -8,7 +8,7 @@
  * and returns the AI's response along with puzzle context analysis.
  */
 
-import { NextRequest, NextResponse } from "next/server";
+import { NextRequest, NextResponse, after } from "next/server";
 import { ObjectId } from "mongodb"; // Import ObjectId for database operations
 import { getDatabase } from "@/lib/mongodb";
 import {
@@ -50,6 +50,147 @@ interface PuzzleContext {
   previouslySolved?: boolean;
 }
 
+/**
+ * Action verbs that typically indicate interaction attempts.
+ * Kept in a Set built once at module load, so each command is checked with
+ * one lookup per word instead of a substring scan per verb.
+ */
+const ACTION_VERBS = new Set([
+  "use",
+  "try",
+  "apply",
+  "place",
+  "insert",
+  "hit",
+  "tap",
+  "wedge",
+  "scrape",
+  "hook",
+  "bridge",
+  "focus",
+  "reflect",
+  "poke",
+  "throw",
+  "fill",
+  "press",
+  "fold",
+  "get",
+  "retrieve",
+  "activate",
+  "deactivate",
+  "open",
+  "close",
+  "cross",
+  "distract",
+  "go",
+  "move",
+  "push",
+  "pull",
+  "turn",
+  "attach",
+  "combine",
+  "break",
+  "cut",
+  "lift",
+  "drop",
+  "give",
+  "take",
+  "read",
+  "climb",
+]);
+
+/**
+ * Phrases in an AI response that suggest a puzzle attempt succeeded.
+ */
+const SUCCESS_INDICATORS = [
+  "it works",
+  "worked",
+  "you manage to",
+  "successfully",
+  "clever",
+  "creative",
+  "good thinking",
+  "well done",
+  "that did the trick",
+  "you've done it",
+  "the way is clear",
+  "opens",
+  "disables",
+  "bypasses",
+  "releases",
+  "you successfully",
+  "the mechanism yields",
+  "clicks open",
+  "activates",
+  "bridge forms",
+  "door slides open",
+  "power restored",
+  "lock disengages",
+  "you retrieve the",
+  "button depresses",
+  "slot accepts",
+  "light turns green",
+  "access granted",
+  "puzzle solved",
+  "unlocked",
+  "reveals",
+  "connects",
+  "fits perfectly",
+];
+
+/**
+ * Phrases in an AI response that suggest a puzzle attempt failed.
+ */
+const FAILURE_INDICATORS = [
+  "doesn't work",
+  "won't work",
+  "no effect",
+  "nothing happens",
+  "cannot",
+  "can't",
+  "unable",
+  "fails",
+  "seems ineffective",
+  "try something else",
+  "isn't strong enough",
+  "doesn't fit",
+  "but nothing changes",
+  "remains sealed",
+  "still blocked",
+  "no reaction",
+  "has no effect",
+  "futile",
+  "pointless",
+  "incorrect",
+  "wrong",
+  "invalid",
+  "resists",
+  "jammed",
+  "stuck",
+  "too heavy",
+  "too large",
+  "too small",
+  "access denied",
+  "remains locked",
+];
+
+/**
+ * Builds one case-insensitive pattern that matches if any indicator matches,
+ * wrapping each indicator exactly as the per-indicator checks did.
+ * Compiled once at module load instead of once per indicator per response.
+ *
+ * @param {string[]} indicators - The indicator phrases to match.
+ * @returns {RegExp} A pattern matching any of the indicators.
+ */
+const buildIndicatorPattern = (indicators: string[]): RegExp =>
+  new RegExp(
+    indicators.map((indicator) => `\b${indicator}\b`).join("|"),
+    "i"
+  );
+
+const SUCCESS_INDICATOR_PATTERN = buildIndicatorPattern(SUCCESS_INDICATORS);
+const FAILURE_INDICATOR_PATTERN = buildIndicatorPattern(FAILURE_INDICATORS);
+
 /**
  * Handles POST requests to the /api/command endpoint.
  * Processes a user's command, interacts with the AI, updates game state, and returns the result.
@@ -161,13 +302,13 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       `[API Command] Interaction ${interaction._id} recorded (pre-response).`
     );
 
-    // --- 7. Update Session History (User Turn) ---
+    // --- 7. Build Session History Entry (User Turn) ---
     // Ensure the history entry conforms to the expected structure (role and parts)
+    // It is written together with the model turn in step 10
     const userHistoryEntry = {
       role: "user" as "user" | "model", // Explicitly type the role
       parts: [{ text: command as string }],
     };
-    await updateSessionHistory(db, session._id, userHistoryEntry);
 
     // --- 8. Prepare History for AI ---
     // Combine existing history with the new user entry
@@ -200,12 +341,15 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       responseObj.text ||
       "I seem to be at a loss for words. Could you try phrasing that differently?";
 
-    // --- 10. Update Session History (Model Turn) ---
-    // Add the AI's response to the session history
-    await updateSessionHistory(db, session._id, {
-      role: "model", // Explicitly type the role
-      parts: [{ text: responseText }],
-    });
+    // --- 10. Update Session History (User and Model Turns) ---
+    // Add the command and the AI's response to the session history in one write
+    await updateSessionHistory(db, session._id, [
+      userHistoryEntry,
+      {
+        role: "model", // Explicitly type the role
+        parts: [{ text: responseText }],
+      },
+    ]);
 
     // --- 11. Analyze AI Response for Puzzle Solution ---
     // Check if the AI's response indicates success for the active puzzle attempt
@@ -236,20 +380,23 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       const newAttempts =
         (currentPuzzleState?.attempts || 0) + (isAttempt ? 1 : 0);
 
+      // Read the clock once for every timestamp written in this update
+      const puzzleUpdateTime = new Date();
+
       // Prepare the update data for the puzzle state
       const puzzleUpdateData: Partial<PuzzleState> = {
         discovered: true, // Mark as discovered if interacted with
         // Set firstDiscoveredAt only if it wasn't already set
         firstDiscoveredAt:
           currentPuzzleState?.firstDiscoveredAt ||
-          (isAttempt ? new Date() : undefined),
+          (isAttempt ? puzzleUpdateTime : undefined),
         attempts: newAttempts,
         solved: puzzleContext.isSolutionSuccess, // Update solved status based on analysis
       };
 
       // Set solvedAt timestamp only if the puzzle is newly solved in this turn
       if (puzzleContext.isSolutionSuccess && !currentPuzzleState?.solved) {
-        puzzleUpdateData.solvedAt = new Date();
+        puzzleUpdateData.solvedAt = puzzleUpdateTime;
         console.log(
           `[API Command] Puzzle ${puzzleContext.activePuzzleId} marked as solved.`
         );
@@ -270,20 +417,33 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
     // --- 13. Update Recorded Interaction (with AI Response) ---
     // Add the AI response, response time, and final puzzle context to the interaction record
     const interactionEndTime = Date.now();
-    await db.collection<InteractionData>("interactions").updateOne(
-      { _id: interaction._id }, // Find the interaction recorded earlier by its ID
-      {
-        $set: {
-          response: responseText,
-          // Calculate response time relative to the interaction start
-          responseTime: interactionEndTime - interaction.timestamp.getTime(),
-          puzzleContext: puzzleContext, // Store the final puzzle context
-        },
+    // Nothing in the response depends on this write, so it runs after the
+    // response has been sent instead of delaying it
+    after(async () => {
+      try {
+        await db.collection<InteractionData>("interactions").updateOne(
+          { _id: interaction._id }, // Find the interaction recorded earlier by its ID
+          {
+            $set: {
+              response: responseText,
+              // Calculate response time relative to the interaction start
+              // (the interaction was recorded with requestStartTime as its timestamp)
+              responseTime: interactionEndTime - requestStartTime,
+              puzzleContext: puzzleContext, // Store the final puzzle context
+            },
+          }
+        );
+        console.log(
+          `[API Command] Interaction ${interaction._id} updated with response and final context.`
+        );
+      } catch (updateError) {
+        // The client already has its response, so just log the failure
+        console.error(
+          `[API Command] Failed to update interaction ${interaction._id}:`,
+          updateError
+        );
       }
-    );
-    console.log(
-      `[API Command] Interaction ${interaction._id} updated with response and final context.`
-    );
+    });
 
     // --- 14. Return Response to Client ---
     const totalRequestTime = Date.now() - requestStartTime;
@@ -341,66 +501,23 @@ function analyzePuzzleContext(
 ): PuzzleContext {
   const lowerCommand = command.toLowerCase().trim();
 
-  // Define action verbs that typically indicate interaction attempts
-  const actionVerbs = [
-    "use",
-    "try",
-    "apply",
-    "place",
-    "insert",
-    "hit",
-    "tap",
-    "wedge",
-    "scrape",
-    "hook",
-    "bridge",
-    "focus",
-    "reflect",
-    "poke",
-    "throw",
-    "fill",
-    "press",
-    "fold",
-    "get",
-    "retrieve",
-    "activate",
-    "deactivate",
-    "open",
-    "close",
-    "cross",
-    "distract",
-    "go",
-    "move",
-    "push",
-    "pull",
-    "turn",
-    "attach",
-    "combine",
-    "break",
-    "cut",
-    "lift",
-    "drop",
-    "give",
-    "take",
-    "read",
-    "climb",
-  ];
-  // Check if the command starts with an action verb or contains one clearly
-  const isActionCommand = actionVerbs.some(
-    (verb) =>
-      lowerCommand.startsWith(verb + " ") ||
-      lowerCommand.includes(" " + verb + " ")
+  // Lowercase each puzzle's key object name once, shared by both lookups below
+  const objectNamesLower = puzzles.map((puzzle) =>
+    puzzle.fixedFunctionObject.name.toLowerCase()
   );
 
   // --- Check for Non-Action Commands Targeting Puzzle Objects (e.g., "examine") ---
-  for (const puzzle of puzzles) {
-    const fixedObjectNameLower = puzzle.fixedFunctionObject.name.toLowerCase();
-    // Specifically check for "examine" or "look at" followed by the object name
-    if (
-      (lowerCommand.startsWith("examine ") ||
-        lowerCommand.startsWith("look at ")) &&
-      lowerCommand.includes(fixedObjectNameLower)
-    ) {
+  // Specifically check for "examine" or "look at" followed by the object name;
+  // the prefix check doesn't depend on the puzzle, so it is made only once
+  if (
+    lowerCommand.startsWith("examine ") ||
+    lowerCommand.startsWith("look at ")
+  ) {
+    const examinedIndex = objectNamesLower.findIndex((name) =>
+      lowerCommand.includes(name)
+    );
+    if (examinedIndex !== -1) {
+      const puzzle = puzzles[examinedIndex];
       return {
         activePuzzleId: puzzle.id,
         isAttemptedSolution: false, // Examining is not an attempt
@@ -414,39 +531,48 @@ function analyzePuzzleContext(
     }
   }
 
+  // Check if the command starts with an action verb or contains one clearly,
+  // i.e. any word that is followed by a space (so not the last word)
+  const commandWords = lowerCommand.split(" ");
+  const isActionCommand = commandWords.some(
+    (word, index) =>
+      index < commandWords.length - 1 && ACTION_VERBS.has(word)
+  );
+
   // If it's not an examination of a puzzle object AND not an action command, assume it's not puzzle-related.
   if (!isActionCommand) {
     return { isAttemptedSolution: false, isSolutionSuccess: false };
   }
 
   // --- Check Action Commands Against Puzzles ---
-  for (const puzzle of puzzles) {
-    const fixedObjectNameLower = puzzle.fixedFunctionObject.name.toLowerCase();
-
-    // Check if the command involves the puzzle's key object
-    if (lowerCommand.includes(fixedObjectNameLower)) {
-      // Analyze if the action described matches the unconventional solution
-      const isUnconventionalAttempt = isCommandMatchingSolution(
-        lowerCommand,
-        puzzle.solutionNarrative,
-        puzzle.fixedFunctionObject.name // Pass object name for context
-      );
-
-      // Determine if it's a conventional use attempt:
-      // It involves the object, uses an action verb, but doesn't match the unconventional solution pattern.
-      const isConventionalAttempt = !isUnconventionalAttempt; // Simplified: any action involving the object that isn't the solution is considered conventional for tracking purposes.
+  // Find the first puzzle whose key object the command involves
+  const puzzleIndex = objectNamesLower.findIndex((name) =>
+    lowerCommand.includes(name)
+  );
+  if (puzzleIndex !== -1) {
+    const puzzle = puzzles[puzzleIndex];
+
+    // Analyze if the action described matches the unconventional solution
+    const isUnconventionalAttempt = isCommandMatchingSolution(
+      lowerCommand,
+      puzzle.solutionNarrative,
+      puzzle.fixedFunctionObject.name // Pass object name for context
+    );
 
-      return {
-        activePuzzleId: puzzle.id,
-        isAttemptedSolution: isUnconventionalAttempt,
-        isSolutionSuccess: false, // Success determined later by AI response
-        puzzleName: puzzle.name,
-        fixedFunctionObject: puzzle.fixedFunctionObject.name,
-        conventionalUse: isConventionalAttempt,
-        previouslyAttempted: (puzzleStates[puzzle.id]?.attempts || 0) > 0,
-        previouslySolved: !!puzzleStates[puzzle.id]?.solved,
-      };
-    }
+    // Determine if it's a conventional use attempt:
+    // It involves the object, uses an action verb, but doesn't match the unconventional solution pattern.
+    const isConventionalAttempt = !isUnconventionalAttempt; // Simplified: any action involving the object that isn't the solution is considered conventional for tracking purposes.
+
+    return {
+      activePuzzleId: puzzle.id,
+      isAttemptedSolution: isUnconventionalAttempt,
+      isSolutionSuccess: false, // Success determined later by AI response
+      puzzleName: puzzle.name,
+      fixedFunctionObject: puzzle.fixedFunctionObject.name,
+      conventionalUse: isConventionalAttempt,
+      previouslyAttempted: (puzzleStates[puzzle.id]?.attempts || 0) > 0,
+      previouslySolved: !!puzzleStates[puzzle.id]?.solved,
+    };
   }
 
   // If it's an action command but doesn't involve any known puzzle object
@@ -473,6 +599,38 @@ function extractKeywords(text: string): string[] {
   return potentialKeywords ? [...new Set(potentialKeywords)] : [];
 }
 
+/**
+ * Lowercase text and keyword set for each solution narrative, keyed by the
+ * narrative itself. Narratives come from the static world config, so these
+ * are computed once instead of on every command.
+ */
+const solutionNarrativeCache = new Map<
+  string,
+  { lowerNarrative: string; keywords: Set<string> }
+>();
+
+/**
+ * Returns the cached lowercase text and keywords of a solution narrative,
+ * computing them on first use.
+ *
+ * @param {string} solutionNarrative - The narrative describing the puzzle's solution.
+ * @returns {{ lowerNarrative: string; keywords: Set<string> }} The lowercase narrative and its keywords.
+ */
+function getSolutionNarrativeInfo(solutionNarrative: string): {
+  lowerNarrative: string;
+  keywords: Set<string>;
+} {
+  let info = solutionNarrativeCache.get(solutionNarrative);
+  if (!info) {
+    info = {
+      lowerNarrative: solutionNarrative.toLowerCase(),
+      keywords: new Set(extractKeywords(solutionNarrative)),
+    };
+    solutionNarrativeCache.set(solutionNarrative, info);
+  }
+  return info;
+}
+
 /**
  * Checks if the verb and potentially the object/target in the command
  * align with the core action described in the solution narrative.
@@ -489,13 +647,14 @@ function isCommandMatchingSolution(
   puzzleObjectName: string
 ): boolean {
   const commandKeywords = extractKeywords(command);
-  const solutionKeywords = extractKeywords(solutionNarrative);
+  const { lowerNarrative, keywords: solutionKeywords } =
+    getSolutionNarrativeInfo(solutionNarrative);
   const lowerPuzzleObjectName = puzzleObjectName.toLowerCase();
 
   // Basic check: Does the command contain the puzzle object AND at least one keyword from the solution?
   if (
     command.includes(lowerPuzzleObjectName) &&
-    commandKeywords.some((ck) => solutionKeywords.includes(ck))
+    commandKeywords.some((ck) => solutionKeywords.has(ck))
   ) {
     return true;
   }
@@ -507,8 +666,8 @@ function isCommandMatchingSolution(
   if (commandVerbMatch) {
     const commandVerb = commandVerbMatch[0];
     if (
-      solutionNarrative.toLowerCase().includes(` ${commandVerb} `) ||
-      solutionNarrative.toLowerCase().startsWith(commandVerb)
+      lowerNarrative.includes(` ${commandVerb} `) ||
+      lowerNarrative.startsWith(commandVerb)
     ) {
       // Further check if the object is also present
       if (command.includes(lowerPuzzleObjectName)) {
@@ -568,83 +727,10 @@ function analyzeResponseForSolution(
   );
 
   // --- Step 2: Check the AI response for explicit success or failure indicators ---
-  // More comprehensive lists of indicators
-  const successIndicators = [
-    "it works",
-    "worked",
-    "you manage to",
-    "successfully",
-    "clever",
-    "creative",
-    "good thinking",
-    "well done",
-    "that did the trick",
-    "you've done it",
-    "the way is clear",
-    "opens",
-    "disables",
-    "bypasses",
-    "releases",
-    "you successfully",
-    "the mechanism yields",
-    "clicks open",
-    "activates",
-    "bridge forms",
-    "door slides open",
-    "power restored",
-    "lock disengages",
-    "you retrieve the",
-    "button depresses",
-    "slot accepts",
-    "light turns green",
-    "access granted",
-    "puzzle solved",
-    "unlocked",
-    "reveals",
-    "connects",
-    "fits perfectly",
-  ];
-  const failureIndicators = [
-    "doesn't work",
-    "won't work",
-    "no effect",
-    "nothing happens",
-    "cannot",
-    "can't",
-    "unable",
-    "fails",
-    "seems ineffective",
-    "try something else",
-    "isn't strong enough",
-    "doesn't fit",
-    "but nothing changes",
-    "remains sealed",
-    "still blocked",
-    "no reaction",
-    "has no effect",
-    "futile",
-    "pointless",
-    "incorrect",
-    "wrong",
-    "invalid",
-    "resists",
-    "jammed",
-    "stuck",
-    "too heavy",
-    "too large",
-    "too small",
-    "access denied",
-    "remains locked",
-  ];
-
   // Check if response contains any success indicator (using word boundaries for accuracy)
-  const hasSuccessIndicator = successIndicators.some(
-    (indicator) => new RegExp(`\b${indicator}\b`, "i").test(lowerResponse) // Case-insensitive check
-  );
+  const hasSuccessIndicator = SUCCESS_INDICATOR_PATTERN.test(lowerResponse);
   // Check if response contains any failure indicator (using word boundaries)
-  const hasFailureIndicator = failureIndicators.some(
-    (indicator) => new RegExp(`\b${indicator}\b`, "i").test(lowerResponse) // Case-insensitive check
-  );
+  const hasFailureIndicator = FAILURE_INDICATOR_PATTERN.test(lowerResponse);
 
   // --- Step 3: Determine overall success ---
   // Success = Command intended to solve + Response indicates success + Response does NOT indicate failure
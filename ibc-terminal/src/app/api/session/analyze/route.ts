@@ -273,6 +273,28 @@ function extractMetricsFromAnalysis(
   return metrics;
 }
 
+// Command prefixes and the type each one is counted as. No two prefixes can
+// match the same command, so the first match is the only one.
+const COMMAND_TYPE_PREFIXES: [string, string][] = [
+  ["look", "look"],
+  ["examine", "examine"],
+  ["use", "use"],
+  ["take", "take"],
+  ["go", "movement"],
+  ["inventory", "inventory"],
+  ["help", "help"],
+];
+
+// Bare directions, also counted as movement
+const MOVEMENT_DIRECTIONS = new Set([
+  "north",
+  "south",
+  "east",
+  "west",
+  "up",
+  "down",
+]);
+
 // Count the types of commands used
 function countUniqueCommandTypes(userMessages: any[]): number {
   const commandTypes = new Set<string>();
@@ -280,19 +302,17 @@ function countUniqueCommandTypes(userMessages: any[]): number {
   userMessages.forEach((msg: any) => {
     const command = msg.content.toLowerCase().trim();
 
-    // Categorize commands
-    if (command.startsWith("look")) commandTypes.add("look");
-    if (command.startsWith("examine")) commandTypes.add("examine");
-    if (command.startsWith("use")) commandTypes.add("use");
-    if (command.startsWith("take")) commandTypes.add("take");
-    if (command.startsWith("go")) commandTypes.add("movement");
-    if (command.startsWith("inventory")) commandTypes.add("inventory");
-    if (command.startsWith("help")) commandTypes.add("help");
-
     // Add directions as a movement type
-    ["north", "south", "east", "west", "up", "down"].forEach((dir: string) => {
-      if (command === dir) commandTypes.add("movement");
-    });
+    if (MOVEMENT_DIRECTIONS.has(command)) {
+      commandTypes.add("movement");
+      return;
+    }
+
+    // Categorize commands by the first matching prefix
+    const match = COMMAND_TYPE_PREFIXES.find(([prefix]) =>
+      command.startsWith(prefix)
+    );
+    if (match) commandTypes.add(match[1]);
   });
 
   return commandTypes.size;
@@ -17,10 +17,14 @@
 
 import React, { useState, useRef, useEffect } from "react";
 
-// Debug logger that only logs in development mode
+// Debug logger that only logs in development mode. A payload can be passed
+// as a function so it is only built when it will actually be logged.
 const debugLog = (message: string, ...data: any[]) => {
   if (process.env.NODE_ENV === "development") {
-    console.log(`[CommandInput] ${message}`, ...data);
+    console.log(
+      `[CommandInput] ${message}`,
+      ...data.map((item) => (typeof item === "function" ? item() : item))
+    );
   }
 };
 
@@ -44,6 +48,15 @@ interface KeystrokeMetrics {
   commandLength: number;
 }
 
+// Fresh metrics accumulator for the next command
+const createEmptyMetrics = (): KeystrokeMetrics => ({
+  keystrokes: [],
+  corrections: 0,
+  hesitations: [],
+  inputDuration: 0,
+  commandLength: 0,
+});
+
 /**
  * CommandInput React component for capturing user commands and research metrics.
  * @param onSubmit - Handler for command submission and metrics
@@ -58,26 +71,22 @@ const CommandInput: React.FC<CommandInputProps> = ({
   const [command, setCommand] = useState<string>("");
   const [inputHistory, setInputHistory] = useState<string[]>([]);
   const [historyIndex, setHistoryIndex] = useState<number>(-1);
-  const [metrics, setMetrics] = useState<KeystrokeMetrics>({
-    keystrokes: [],
-    corrections: 0,
-    hesitations: [],
-    inputDuration: 0,
-    commandLength: 0,
-  });
+  // Metrics are never rendered, so accumulate them in place in a ref instead
+  // of copying the keystroke array into new state on every key event
+  const metricsRef = useRef<KeystrokeMetrics>(createEmptyMetrics());
   const [startTime, setStartTime] = useState<number | null>(null);
   const [lastKeystrokeTime, setLastKeystrokeTime] = useState<number | null>(
     null
   );
   const inputRef = useRef<HTMLInputElement>(null);
 
-  debugLog("Rendering CommandInput", {
+  debugLog("Rendering CommandInput", () => ({
     command,
     isDisabled,
     isSessionComplete,
     historyLength: inputHistory.length,
     historyIndex,
-  });
+  }));
 
   // Focus input on component mount
   useEffect(() => {
@@ -100,11 +109,11 @@ const CommandInput: React.FC<CommandInputProps> = ({
     const currentTime = Date.now();
     const newValue = e.target.value;
 
-    debugLog("Input changed", {
+    debugLog("Input changed", () => ({
       prevValue: command,
       newValue,
       currentTime,
-    });
+    }));
 
     // Start tracking if this is the first character
     if (command === "" && newValue !== "") {
@@ -114,60 +123,51 @@ const CommandInput: React.FC<CommandInputProps> = ({
 
     // Track backspace/delete operations for corrections
     if (newValue.length < command.length) {
-      debugLog("Correction detected", {
+      debugLog("Correction detected", () => ({
         prevLength: command.length,
         newLength: newValue.length,
-      });
-
-      setMetrics((prev) => ({
-        ...prev,
-        corrections: prev.corrections + 1,
       }));
+
+      metricsRef.current.corrections += 1;
     }
 
     // Track hesitations (pauses between keystrokes)
     if (lastKeystrokeTime && currentTime - lastKeystrokeTime > 1000) {
       const hesitationDuration = currentTime - lastKeystrokeTime;
-      debugLog("Hesitation detected", {
+      debugLog("Hesitation detected", () => ({
         duration: hesitationDuration,
         position: command.length,
-      });
-
-      setMetrics((prev) => ({
-        ...prev,
-        hesitations: [
-          ...prev.hesitations,
-          { duration: hesitationDuration, position: command.length },
-        ],
       }));
+
+      metricsRef.current.hesitations.push({
+        duration: hesitationDuration,
+        position: command.length,
+      });
     }
 
     // Update keystroke metrics
     const lastChar = newValue.length > 0 ? newValue.slice(-1) : "";
-    debugLog("Adding keystroke to metrics", {
+    debugLog("Adding keystroke to metrics", () => ({
       key: lastChar,
       timestamp: currentTime,
-    });
-
-    setMetrics((prev) => ({
-      ...prev,
-      keystrokes: [
-        ...prev.keystrokes,
-        { key: lastChar, timestamp: currentTime },
-      ],
     }));
 
+    metricsRef.current.keystrokes.push({
+      key: lastChar,
+      timestamp: currentTime,
+    });
+
     setLastKeystrokeTime(currentTime);
     setCommand(newValue);
   };
 
   const handleKeyDown = (e: React.KeyboardEvent<HTMLInputElement>) => {
-    debugLog("Key down event", {
+    debugLog("Key down event", () => ({
       key: e.key,
       keyCode: e.keyCode,
       ctrlKey: e.ctrlKey,
       altKey: e.altKey,
-    });
+    }));
 
     // Handle up/down arrows for command history
     if (e.key === "ArrowUp" && inputHistory.length > 0) {
@@ -204,11 +204,8 @@ const CommandInput: React.FC<CommandInputProps> = ({
     }
 
     // Track current keystroke
-    debugLog("Recording keydown in metrics", { key: e.key });
-    setMetrics((prev) => ({
-      ...prev,
-      keystrokes: [...prev.keystrokes, { key: e.key, timestamp: Date.now() }],
-    }));
+    debugLog("Recording keydown in metrics", () => ({ key: e.key }));
+    metricsRef.current.keystrokes.push({ key: e.key, timestamp: Date.now() });
   };
 
   const handleSubmit = (e: React.FormEvent) => {
@@ -226,6 +223,7 @@ const CommandInput: React.FC<CommandInputProps> = ({
     const endTime = Date.now();
     const inputDuration = startTime ? endTime - startTime : 0;
 
+    const metrics = metricsRef.current;
     const finalMetrics = {
       ...metrics,
       inputDuration,
@@ -258,13 +256,7 @@ const CommandInput: React.FC<CommandInputProps> = ({
 
     // Reset input and metrics
     setCommand("");
-    setMetrics({
-      keystrokes: [],
-      corrections: 0,
-      hesitations: [],
-      inputDuration: 0,
-      commandLength: 0,
-    });
+    metricsRef.current = createEmptyMetrics();
     setStartTime(null);
     setLastKeystrokeTime(null);
     debugLog("Reset input state after submission");
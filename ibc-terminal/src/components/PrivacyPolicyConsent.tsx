@@ -29,6 +29,22 @@ interface PrivacyPolicyConsentProps {
 
 const PRIVACY_POLICY = `TERMATURE PRIVACY POLICY\n\nWhat data is collected?\n- All commands you enter in the terminal\n- Keystroke-level typing metrics (timing, corrections, hesitations)\n- Session duration and puzzle progress\n- Anonymous device/session ID\n\nHow is your data used?\n- For research on problem-solving and cognitive science\n- To analyze patterns in puzzle solving\n\nData is anonymous and cannot be traced back to you. No personal identifiers are collected.\n\nBy typing 'y' and pressing Enter, you consent to this data collection.\nYou must provide consent to proceed to the main menu.`;
 
+// Static parts of the consent screen, created once so that typing into the
+// input only re-renders the input and error line
+const CONSENT_STATUS_BAR = (
+  <div className="flex justify-between items-center p-2 text-xs border-b border-gray-700 text-terminal-green font-mono bg-[var(--status-bar-bg)]">
+    <div>Terminal</div>
+    <div>Privacy Policy Consent</div>
+    <div>00:00</div>
+  </div>
+);
+
+const CONSENT_POLICY_TEXT = (
+  <pre className="mb-4 whitespace-pre-wrap text-left text-terminal-green opacity-80">
+    {PRIVACY_POLICY}
+  </pre>
+);
+
 const PrivacyPolicyConsent: React.FC<PrivacyPolicyConsentProps> = ({
   onConsent,
 }) => {
@@ -52,15 +68,9 @@ const PrivacyPolicyConsent: React.FC<PrivacyPolicyConsentProps> = ({
   return (
     <div className="flex flex-col h-screen max-h-screen">
       <div className="flex-grow overflow-hidden flex flex-col">
-        <div className="flex justify-between items-center p-2 text-xs border-b border-gray-700 text-terminal-green font-mono bg-[var(--status-bar-bg)]">
-          <div>Terminal</div>
-          <div>Privacy Policy Consent</div>
-          <div>00:00</div>
-        </div>
+        {CONSENT_STATUS_BAR}
         <div className="flex-grow p-4 overflow-y-auto">
-          <pre className="mb-4 whitespace-pre-wrap text-left text-terminal-green opacity-80">
-            {PRIVACY_POLICY}
-          </pre>
+          {CONSENT_POLICY_TEXT}
           {error && <div className="text-terminal-red mt-2">{error}</div>}
         </div>
         <form
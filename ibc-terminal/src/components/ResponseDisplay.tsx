@@ -15,6 +15,7 @@
 "use client";
 
 import React, { useEffect, useRef } from "react";
+import { getLoopingSound, releaseLoopingSound } from "../utils/terminal";
 
 interface Message {
   role: "system" | "user" | "assistant" | "model";
@@ -38,10 +39,14 @@ interface ResponseDisplayProps {
   isLoading: boolean;
 }
 
-// Debug logger that only logs in development mode
+// Debug logger that only logs in development mode. A payload can be passed
+// as a function so it is only built when it will actually be logged.
 const debugLog = (message: string, ...data: any[]) => {
   if (process.env.NODE_ENV === "development") {
-    console.log(`[ResponseDisplay] ${message}`, ...data);
+    console.log(
+      `[ResponseDisplay] ${message}`,
+      ...data.map((item) => (typeof item === "function" ? item() : item))
+    );
   }
 };
 
@@ -84,10 +89,10 @@ const parseTextSegments = (text: string): TextSegment[] => {
     });
   }
 
-  debugLog("Parsed text segments", {
+  debugLog("Parsed text segments", () => ({
     segmentCount: segments.length,
     poemSegments: segments.filter((s) => s.isPoem).length,
-  });
+  }));
 
   return segments;
 };
@@ -164,11 +169,11 @@ const parseTextWithFormatting = (text: string): TextSegment[] => {
     }
   }
 
-  debugLog("Parsed text segments with formatting", {
+  debugLog("Parsed text segments with formatting", () => ({
     segmentCount: result.length,
     poemSegments: result.filter((s) => s.isPoem).length,
     emphasizedSegments: result.filter((s) => s.isEmphasized).length,
-  });
+  }));
 
   return result;
 };
@@ -222,6 +227,69 @@ const processContentForDisplay = (content: string): TextSegment[] => {
   }));
 };
 
+// Render a specific text segment based on its type
+const renderTextSegment = (segment: TextSegment, index: number) => {
+  if (segment.isPoem) {
+    return (
+      <span
+        key={index}
+        className="italic text-terminal-cyan animate-pulse-subtle block my-2 px-4 border-l-2 border-terminal-cyan"
+      >
+        {segment.text}
+      </span>
+    );
+  }
+
+  if (segment.isEmphasized) {
+    return (
+      <span
+        key={index}
+        className="font-bold text-terminal-yellow animate-glow-subtle inline-block"
+      >
+        {segment.text}
+      </span>
+    );
+  }
+
+  return <span key={index}>{segment.text}</span>;
+};
+
+/**
+ * Renders a single terminal message. Memoized so that while one message is being
+ * typed out, the rest of the transcript is not re-parsed and re-rendered.
+ * @param message - The message object to display
+ */
+const MessageItem = React.memo(function MessageItem({
+  message,
+}: {
+  message: Message;
+}) {
+  debugLog("Rendering message", () => ({ role: message.role }));
+
+  // Use pre-parsed segments if available, otherwise process the content
+  const processedSegments =
+    message.segments || processContentForDisplay(message.content);
+
+  return (
+    <div className="pb-2">
+      {message.role === "user" ? (
+        <div className="flex">
+          <span className="text-terminal-green mr-2 opacity-80">{">"}</span>
+          <span className="text-terminal-yellow">{message.content}</span>
+        </div>
+      ) : message.role === "system" ? (
+        <div className="text-gray-400 whitespace-pre-wrap">
+          {processedSegments.map((segment, i) => renderTextSegment(segment, i))}
+        </div>
+      ) : (
+        <div className="text-terminal-blue whitespace-pre-wrap">
+          {processedSegments.map((segment, i) => renderTextSegment(segment, i))}
+        </div>
+      )}
+    </div>
+  );
+});
+
 /**
  * ResponseDisplay React component for showing terminal messages and feedback.
  * @param messages - Array of message objects
@@ -234,33 +302,27 @@ const ResponseDisplay: React.FC<ResponseDisplayProps> = ({
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const thinkingSoundRef = useRef<HTMLAudioElement | null>(null);
 
-  debugLog("Rendering ResponseDisplay", {
+  debugLog("Rendering ResponseDisplay", () => ({
     messageCount: messages.length,
     isLoading,
-  });
+  }));
 
   // Manage thinking sound when loading state changes
   useEffect(() => {
     debugLog("Loading state changed", { isLoading });
     if (isLoading) {
       // Start thinking sound when loading starts
-      thinkingSoundRef.current = new Audio("/thinking.wav");
-      thinkingSoundRef.current.loop = true;
+      thinkingSoundRef.current = getLoopingSound("/thinking.wav");
       thinkingSoundRef.current.play().catch((err) => {
         debugLog("Error playing thinking sound", err);
       });
-    } else if (thinkingSoundRef.current) {
-      // Stop thinking sound when loading stops
-      thinkingSoundRef.current.pause();
-      thinkingSoundRef.current.currentTime = 0;
-      thinkingSoundRef.current = null;
     }
 
     return () => {
-      // Cleanup on unmount
+      // Stop thinking sound when loading stops, or on unmount
       if (thinkingSoundRef.current) {
-        thinkingSoundRef.current.pause();
-        thinkingSoundRef.current.currentTime = 0;
+        releaseLoopingSound(thinkingSoundRef.current);
+        thinkingSoundRef.current = null;
       }
     };
   }, [isLoading]);
@@ -274,67 +336,11 @@ const ResponseDisplay: React.FC<ResponseDisplayProps> = ({
     }
   }, [messages]);
 
-  // Render a specific text segment based on its type
-  const renderTextSegment = (segment: TextSegment, index: number) => {
-    if (segment.isPoem) {
-      return (
-        <span
-          key={index}
-          className="italic text-terminal-cyan animate-pulse-subtle block my-2 px-4 border-l-2 border-terminal-cyan"
-        >
-          {segment.text}
-        </span>
-      );
-    }
-    
-    if (segment.isEmphasized) {
-      return (
-        <span
-          key={index}
-          className="font-bold text-terminal-yellow animate-glow-subtle inline-block"
-        >
-          {segment.text}
-        </span>
-      );
-    }
-    
-    return <span key={index}>{segment.text}</span>;
-  };
-
   return (
     <div className="space-y-4 font-mono text-sm">
-      {messages.map((message, index) => {
-        debugLog(`Processing message ${index}`, { role: message.role });
-
-        // Use pre-parsed segments if available, otherwise process the content
-        const processedSegments =
-          message.segments || processContentForDisplay(message.content);
-
-        return (
-          <div key={index} className="pb-2">
-            {message.role === "user" ? (
-              <div className="flex">
-                <span className="text-terminal-green mr-2 opacity-80">
-                  {">"}
-                </span>
-                <span className="text-terminal-yellow">{message.content}</span>
-              </div>
-            ) : message.role === "system" ? (
-              <div className="text-gray-400 whitespace-pre-wrap">
-                {processedSegments.map((segment, i) =>
-                  renderTextSegment(segment, i)
-                )}
-              </div>
-            ) : (
-              <div className="text-terminal-blue whitespace-pre-wrap">
-                {processedSegments.map((segment, i) =>
-                  renderTextSegment(segment, i)
-                )}
-              </div>
-            )}
-          </div>
-        );
-      })}
+      {messages.map((message, index) => (
+        <MessageItem key={index} message={message} />
+      ))}
       {isLoading && (
         <div className="inline-block">
           <span className="animate-blink">_</span>
@@ -16,17 +16,26 @@
 
 "use client";
 
-import React, { useState, useEffect, useRef } from "react";
+import React, { useState, useEffect, useRef, useMemo } from "react";
 import CommandInput from "./CommandInput";
 import ResponseDisplay from "./ResponseDisplay";
 import PrivacyPolicyConsent, { getCookie } from "./PrivacyPolicyConsent";
 import { trackUserInteraction } from "../lib/dataCollection";
 import { getWorldData } from "../lib/worldAllocation";
-
-// Debug logger that only logs in development mode
+import {
+  getLoopingSound,
+  preloadSound,
+  releaseLoopingSound,
+} from "../utils/terminal";
+
+// Debug logger that only logs in development mode. A payload can be passed
+// as a function so it is only built when it will actually be logged.
 const debugLog = (message: string, ...data: any[]) => {
   if (process.env.NODE_ENV === "development") {
-    console.log(`[Terminal] ${message}`, ...data);
+    console.log(
+      `[Terminal] ${message}`,
+      ...data.map((item) => (typeof item === "function" ? item() : item))
+    );
   }
 };
 
@@ -53,16 +62,40 @@ interface TextSegment {
   isEmphasized?: boolean; // New property for emphasized text
 }
 
-// Function to format session time (MM:SS)
-const formatSessionTime = (startTime: number): string => {
-  const elapsed = Math.floor((Date.now() - startTime) / 1000);
-  const minutes = Math.floor(elapsed / 60);
-  const seconds = elapsed % 60;
+// Commands that end the session, matched case-insensitively
+const SESSION_END_COMMANDS = new Set(["exit", "quit", "end session", "finish"]);
+
+// Function to format session time (MM:SS) from whole elapsed seconds
+const formatSessionTime = (elapsedSeconds: number): string => {
+  const minutes = Math.floor(elapsedSeconds / 60);
+  const seconds = elapsedSeconds % 60;
   return `${minutes.toString().padStart(2, "0")}:${seconds
     .toString()
     .padStart(2, "0")}`;
 };
 
+interface StatusBarProps {
+  worldName: string;
+  variant: "A" | "B";
+  sessionTime: string;
+}
+
+// Header bar is memoized so the per-character typewriter updates to messages
+// don't rebuild it; it only changes with the world, variant or clock
+const StatusBar = React.memo(function StatusBar({
+  worldName,
+  variant,
+  sessionTime,
+}: StatusBarProps) {
+  return (
+    <div className="flex justify-between items-center p-2 text-xs border-b border-gray-700 text-terminal-green font-mono bg-[var(--status-bar-bg)]">
+      <div>{worldName}</div>
+      <div>{variant === "A" ? "Control Variant" : "Experimental Variant"}</div>
+      <div>{sessionTime}</div>
+    </div>
+  );
+});
+
 /**
  * Analyzes a string to detect if it contains special formatting like POEM tags and emphasized text
  * @param text - Current text being typed out
@@ -78,42 +111,29 @@ const analyzePartialPoemSegments = (text: string): TextSegment[] => {
   // Handle edge case of empty string
   if (!text) return [{ text: "", isPoem: false }];
 
-  // Analyze each character
-  for (let i = 0; i < text.length; i++) {
-    // Check for opening tag sequence
-    if (!inPoemContent && text[i] === "<") {
-      // Possible start of opening tag
-      if (i + 4 < text.length && text.substring(i, i + 6) === "<POEM>") {
-        // Found opening tag
-        if (i > currentSegmentStart) {
-          // Add previous non-poem segment
-          segments.push({
-            text: text.substring(currentSegmentStart, i),
-            isPoem: false,
-          });
-        }
-        inPoemContent = true;
-        currentSegmentStart = i + 6; // Start collecting after tag
-        i += 5; // Skip the rest of the tag
-        continue;
-      }
+  // Jump from tag to tag with indexOf rather than inspecting every character,
+  // since this runs again for each character of the typing animation
+  while (true) {
+    const tag = inPoemContent ? "</POEM>" : "<POEM>";
+    const tagIndex = text.indexOf(tag, currentSegmentStart);
+    if (tagIndex === -1) break;
+
+    if (inPoemContent) {
+      // Found closing tag
+      segments.push({
+        text: text.substring(currentSegmentStart, tagIndex),
+        isPoem: true,
+      });
+    } else if (tagIndex > currentSegmentStart) {
+      // Found opening tag, add previous non-poem segment
+      segments.push({
+        text: text.substring(currentSegmentStart, tagIndex),
+        isPoem: false,
+      });
     }
 
-    // Check for closing tag
-    else if (inPoemContent && text[i] === "<") {
-      // Possible start of closing tag
-      if (i + 6 < text.length && text.substring(i, i + 7) === "</POEM>") {
-        // Found closing tag
-        segments.push({
-          text: text.substring(currentSegmentStart, i),
-          isPoem: true,
-        });
-        inPoemContent = false;
-        currentSegmentStart = i + 7; // Start collecting after tag
-        i += 6; // Skip the rest of the tag
-        continue;
-      }
-    }
+    inPoemContent = !inPoemContent;
+    currentSegmentStart = tagIndex + tag.length; // Start collecting after tag
   }
 
   // Handle any remaining text
@@ -193,6 +213,48 @@ const analyzePartialPoemSegments = (text: string): TextSegment[] => {
   return finalSegments;
 };
 
+/**
+ * Reveals text one character at a time on a per-character delay schedule, but
+ * applies at most one update per animation frame: every character that has
+ * come due since the previous frame is added in a single update
+ * @param text - Full text to reveal
+ * @param getDelay - Returns the delay in ms before the next character
+ * @param onUpdate - Called with the text revealed so far
+ * @returns Promise that resolves once the whole text has been revealed
+ */
+const typeOutText = (
+  text: string,
+  getDelay: () => number,
+  onUpdate: (revealedText: string) => void
+): Promise<void> =>
+  new Promise((resolve, reject) => {
+    let revealedLength = 0;
+    let nextCharTime = performance.now();
+
+    const step = () => {
+      try {
+        const now = performance.now();
+        const previousLength = revealedLength;
+        while (revealedLength < text.length && nextCharTime <= now) {
+          revealedLength++;
+          nextCharTime += getDelay();
+        }
+        if (revealedLength !== previousLength) {
+          onUpdate(text.substring(0, revealedLength));
+        }
+        if (revealedLength < text.length) {
+          requestAnimationFrame(step);
+        } else {
+          resolve();
+        }
+      } catch (error) {
+        reject(error);
+      }
+    };
+
+    requestAnimationFrame(step);
+  });
+
 /**
  * Terminal React component for the main experiment interface and session logic.
  * @param deviceId - Unique device/session ID
@@ -213,28 +275,42 @@ const Terminal: React.FC<TerminalProps> = ({ deviceId, worldId, variant }) => {
   const initializedRef = useRef<boolean>(false);
   const [sessionTime, setSessionTime] = useState<string>("00:00");
 
-  // Update session time continuously
+  // Session clock starts at the first message; the timer effect depends on
+  // this value only, so it isn't torn down and restarted on every message or
+  // typed character
+  const sessionStartTime = messages.length > 0 ? messages[0].timestamp : null;
+
+  // Update session time once per second
   useEffect(() => {
-    if (messages.length > 0) {
-      // Use requestAnimationFrame to update time smoothly during animations
-      let frameId: number;
+    if (sessionStartTime !== null) {
+      const startTime = sessionStartTime;
+      let timeoutId: ReturnType<typeof setTimeout>;
+      // Last displayed second, so the string is only formatted and pushed into
+      // state when it actually changes (a timer can fire slightly early)
+      let lastSecond = -1;
 
       const updateTime = () => {
-        setSessionTime(formatSessionTime(messages[0].timestamp));
-        frameId = requestAnimationFrame(updateTime);
+        // Read the clock once and work in integer milliseconds
+        const elapsedMs = Date.now() - startTime;
+        const elapsedSeconds = Math.floor(elapsedMs / 1000);
+        if (elapsedSeconds !== lastSecond) {
+          lastSecond = elapsedSeconds;
+          setSessionTime(formatSessionTime(elapsedSeconds));
+        }
+        // Sleep until the next whole second instead of polling every frame
+        timeoutId = setTimeout(updateTime, 1000 - (elapsedMs % 1000));
       };
 
-      // Start the animation frame loop
-      frameId = requestAnimationFrame(updateTime);
+      updateTime();
 
       // Clean up
       return () => {
-        cancelAnimationFrame(frameId);
+        clearTimeout(timeoutId);
       };
     }
-  }, [messages]);
+  }, [sessionStartTime]);
 
-  debugLog("Rendering Terminal", {
+  debugLog("Rendering Terminal", () => ({
     deviceId,
     worldId,
     variant,
@@ -245,17 +321,25 @@ const Terminal: React.FC<TerminalProps> = ({ deviceId, worldId, variant }) => {
     messageCount: messages.length,
     sessionTime,
     initialized: initializedRef.current,
-  });
+  }));
+
+  // Preload sound effects up front so the first response doesn't wait on them
+  useEffect(() => {
+    preloadSound("/thinking.wav");
+    preloadSound("/typing.wav");
+  }, []);
 
-  // Auto-scroll to bottom when messages change
+  // Auto-scroll to bottom when messages change (this also follows the
+  // typewriter animation, since every typed character updates messages)
   useEffect(() => {
     debugLog("Messages changed, scrolling to bottom");
-    if (terminalRef.current) {
-      terminalRef.current.scrollTop = terminalRef.current.scrollHeight;
-      debugLog("Scrolled to bottom", {
-        scrollHeight: terminalRef.current.scrollHeight,
-        clientHeight: terminalRef.current.clientHeight,
-      });
+    const terminal = terminalRef.current;
+    if (terminal) {
+      terminal.scrollTop = terminal.scrollHeight;
+      debugLog("Scrolled to bottom", () => ({
+        scrollHeight: terminal.scrollHeight,
+        clientHeight: terminal.clientHeight,
+      }));
     }
   }, [messages]);
 
@@ -438,8 +522,7 @@ ${worldDescriptions
 
         // Play typing sound for the animation
         debugLog("Starting typing sound for introduction animation");
-        const typingSound = new Audio("/typing.wav");
-        typingSound.loop = true;
+        const typingSound = getLoopingSound("/typing.wav");
 
         try {
           await typingSound.play();
@@ -458,44 +541,42 @@ ${worldDescriptions
             textLength: initialMessage.length,
           });
 
-          let displayedText = "";
           // Adjust speed based on text length
           const speed = Math.min(Math.max(30, initialMessage.length / 25), 70);
           const delay = 1000 / speed;
           debugLog("Animation parameters", { speed, delay });
 
-          for (let i = 0; i < initialMessage.length; i++) {
-            displayedText += initialMessage[i];
-
-            // Analyze for poem segments in the current partial text
-            const segments = analyzePartialPoemSegments(displayedText);
-
-            // Update message
-            setMessages((prev) => {
-              const newMessages = [...prev];
-              const messageIndex = newMessages.findIndex(
-                (msg) => msg.role === "model" && msg.timestamp === timestamp
-              );
-              if (messageIndex !== -1) {
-                newMessages[messageIndex].content = displayedText;
-                newMessages[messageIndex].segments = segments;
-              } else {
-                debugLog("Failed to find message for animation update", {
-                  timestamp,
-                  currentLength: i,
-                });
-              }
-              return newMessages;
-            });
-
-            // Scroll as we type
-            if (terminalRef.current) {
-              terminalRef.current.scrollTop = terminalRef.current.scrollHeight;
+          // Characters still follow the per-character delay, but all of those
+          // due by the next frame are applied in one update
+          await typeOutText(
+            initialMessage,
+            () => delay,
+            (displayedText) => {
+              // Analyze for poem segments in the current partial text
+              const segments = analyzePartialPoemSegments(displayedText);
+
+              // Update message
+              setMessages((prev) => {
+                const newMessages = [...prev];
+                const messageIndex = newMessages.findIndex(
+                  (msg) => msg.role === "model" && msg.timestamp === timestamp
+                );
+                if (messageIndex !== -1) {
+                  newMessages[messageIndex] = {
+                    ...newMessages[messageIndex],
+                    content: displayedText,
+                    segments,
+                  };
+                } else {
+                  debugLog("Failed to find message for animation update", {
+                    timestamp,
+                    currentLength: displayedText.length,
+                  });
+                }
+                return newMessages;
+              });
             }
-
-            // Wait before adding next character
-            await new Promise((resolve) => setTimeout(resolve, delay));
-          }
+          );
 
           debugLog("Text animation completed successfully");
         } catch (animError) {
@@ -509,9 +590,11 @@ ${worldDescriptions
               (msg) => msg.role === "model" && msg.timestamp === timestamp
             );
             if (messageIndex !== -1) {
-              newMessages[messageIndex].content = initialMessage;
-              newMessages[messageIndex].segments =
-                analyzePartialPoemSegments(initialMessage);
+              newMessages[messageIndex] = {
+                ...newMessages[messageIndex],
+                content: initialMessage,
+                segments: analyzePartialPoemSegments(initialMessage),
+              };
               debugLog("Set full message content after animation failure");
             } else {
               debugLog(
@@ -523,8 +606,7 @@ ${worldDescriptions
         } finally {
           // Stop typing sound
           debugLog("Stopping typing sound");
-          typingSound.pause();
-          typingSound.currentTime = 0;
+          releaseLoopingSound(typingSound);
         }
       } catch (error) {
         debugLog("Error in terminal initialization", error);
@@ -642,12 +724,7 @@ ${worldDescriptions
     }
 
     // Check for session completion command
-    if (
-      command.toLowerCase() === "exit" ||
-      command.toLowerCase() === "quit" ||
-      command.toLowerCase() === "end session" ||
-      command.toLowerCase() === "finish"
-    ) {
+    if (SESSION_END_COMMANDS.has(command.toLowerCase())) {
       debugLog("Session completion command detected", { command });
       setSessionComplete(true);
 
@@ -785,8 +862,7 @@ ${worldDescriptions
 
       // Play typing sound for the animation
       debugLog("Starting typing sound for animation");
-      const typingSound = new Audio("/typing.wav");
-      typingSound.loop = true;
+      const typingSound = getLoopingSound("/typing.wav");
 
       try {
         await typingSound.play();
@@ -844,12 +920,10 @@ ${worldDescriptions
           maxDelayFactor,
         });
 
-        let currentText = "";
-
-        for (let i = 0; i < responseText.length; i++) {
-          currentText += responseText[i];
-
-          // Parse poem segments in real-time as we add each character
+        // Each character still gets its own random delay, but all of those
+        // due by the next frame are applied in one update
+        await typeOutText(responseText, getRandomDelay, (currentText) => {
+          // Parse poem segments in real-time as characters are added
           const segments = analyzePartialPoemSegments(currentText);
 
           // Update the message content with current text
@@ -859,25 +933,20 @@ ${worldDescriptions
               (msg) => msg.role === "model" && msg.timestamp === timestamp
             );
             if (messageIndex !== -1) {
-              newMessages[messageIndex].content = currentText;
-              newMessages[messageIndex].segments = segments;
+              newMessages[messageIndex] = {
+                ...newMessages[messageIndex],
+                content: currentText,
+                segments,
+              };
             } else {
               debugLog("Failed to find message for animation update", {
                 timestamp,
-                currentLength: i,
+                currentLength: currentText.length,
               });
             }
             return newMessages;
           });
-
-          // Scroll to bottom with each character update
-          if (terminalRef.current) {
-            terminalRef.current.scrollTop = terminalRef.current.scrollHeight;
-          }
-
-          // Wait a random amount of time before the next character
-          await new Promise((resolve) => setTimeout(resolve, getRandomDelay()));
-        }
+        });
 
         debugLog("Text animation complete");
       };
@@ -896,9 +965,11 @@ ${worldDescriptions
             (msg) => msg.role === "model" && msg.timestamp === timestamp
           );
           if (messageIndex !== -1) {
-            newMessages[messageIndex].content = responseText;
-            newMessages[messageIndex].segments =
-              analyzePartialPoemSegments(responseText);
+            newMessages[messageIndex] = {
+              ...newMessages[messageIndex],
+              content: responseText,
+              segments: analyzePartialPoemSegments(responseText),
+            };
             debugLog("Set full response text after animation failure");
           } else {
             debugLog("Failed to find message after animation failure");
@@ -908,8 +979,7 @@ ${worldDescriptions
       } finally {
         // Stop typing sound when animation is complete
         debugLog("Stopping typing sound");
-        typingSound.pause();
-        typingSound.currentTime = 0;
+        releaseLoopingSound(typingSound);
       }
     } catch (error) {
       debugLog("Error processing command", error);
@@ -928,20 +998,23 @@ ${worldDescriptions
 
   // Removed history toggle function
 
+  // Look the world name up only when the selected world changes
+  const worldName = useMemo(
+    () =>
+      selectedWorldId !== undefined
+        ? getWorldData(selectedWorldId).name
+        : "Terminal",
+    [selectedWorldId]
+  );
+
   return (
     <div className="flex flex-col h-screen max-h-screen">
       <div className="flex-grow overflow-hidden flex flex-col">
-        <div className="flex justify-between items-center p-2 text-xs border-b border-gray-700 text-terminal-green font-mono bg-[var(--status-bar-bg)]">
-          <div>
-            {selectedWorldId !== undefined
-              ? getWorldData(selectedWorldId).name
-              : "Terminal"}
-          </div>
-          <div>
-            {variant === "A" ? "Control Variant" : "Experimental Variant"}
-          </div>
-          <div>{messages.length > 0 ? `${sessionTime}` : "00:00"}</div>
-        </div>
+        <StatusBar
+          worldName={worldName}
+          variant={variant}
+          sessionTime={messages.length > 0 ? sessionTime : "00:00"}
+        />
 
         <div ref={terminalRef} className="flex-grow p-4 overflow-y-auto">
           <ResponseDisplay messages={messages} isLoading={isLoading} />
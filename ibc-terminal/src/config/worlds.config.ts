@@ -1880,9 +1880,14 @@ export const worldDefinitions: WorldDefinition[] = [
   // },
 ];
 
+// Index of worlds by ID, built once at import so lookups don't rescan the list
+const worldDefinitionsById = new Map<number, WorldDefinition>(
+  worldDefinitions.map((world) => [world.id, world])
+);
+
 // Helper function (or place it in a utility file)
 export const getWorldConfig = (worldId: number): WorldDefinition => {
-  const world = worldDefinitions.find((w) => w.id === worldId);
+  const world = worldDefinitionsById.get(worldId);
   if (!world) {
     throw new Error(`Configuration for world ID ${worldId} not found.`);
   }
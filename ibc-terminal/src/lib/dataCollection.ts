@@ -67,6 +67,125 @@ const debugLog = (message: string, ...data: any[]) => {
 const LOCAL_STORAGE_KEY = "ibc_terminal_interactions";
 const SESSION_SUMMARY_KEY = "ibc_terminal_session_summary";
 
+// In-memory copy of the stored interactions. It is loaded from localStorage
+// once and written back by flushStoredInteractions, instead of re-parsing and
+// re-serializing the whole list on every tracked keystroke batch.
+let interactionBuffer: InteractionData[] | null = null;
+// Position of each buffered interaction, keyed by device ID and timestamp
+const interactionIndex = new Map<string, number>();
+// Interactions this tab has added or changed since the last flush, keyed like
+// interactionIndex; the value records whether this tab created the interaction
+const pendingInteractionKeys = new Map<string, boolean>();
+
+const getInteractionKey = (deviceId: string, timestamp: number) =>
+  `${deviceId}:${timestamp}`;
+
+// Maps each interaction's key to its position in the list
+const indexInteractions = (
+  interactions: InteractionData[],
+  index: Map<string, number>
+) => {
+  index.clear();
+  interactions.forEach((interaction, position) => {
+    index.set(
+      getInteractionKey(interaction.deviceId, interaction.timestamp),
+      position
+    );
+  });
+};
+
+// Replaces the buffer with the given interactions and rebuilds its index
+const setInteractionBuffer = (interactions: InteractionData[]) => {
+  indexInteractions(interactions, interactionIndex);
+  interactionBuffer = interactions;
+};
+
+// Reads the interactions currently in localStorage
+const readStoredInteractions = (): InteractionData[] => {
+  const storedData = localStorage.getItem(LOCAL_STORAGE_KEY);
+  return storedData ? JSON.parse(storedData) : [];
+};
+
+// Returns the buffered interactions, loading them from localStorage on first use
+const getBufferedInteractions = (): InteractionData[] => {
+  if (interactionBuffer === null) {
+    setInteractionBuffer(readStoredInteractions());
+  }
+  return interactionBuffer!;
+};
+
+// Records that a buffered interaction needs writing back, and queues the write
+const markInteractionPending = (key: string, isNew: boolean) => {
+  pendingInteractionKeys.set(key, pendingInteractionKeys.get(key) || isNew);
+  scheduleInteractionFlush();
+};
+
+// Writes this tab's pending interactions back to localStorage. The current
+// stored list is re-read and merged rather than overwritten, since another tab
+// may have added interactions, or uploaded and cleared them, in the meantime.
+const flushStoredInteractions = () => {
+  try {
+    if (typeof window === "undefined" || !window.localStorage) return;
+    if (interactionBuffer === null || pendingInteractionKeys.size === 0) return;
+    const buffer = interactionBuffer;
+    const merged = readStoredInteractions();
+    const mergedIndex = new Map<string, number>();
+    indexInteractions(merged, mergedIndex);
+    pendingInteractionKeys.forEach((isNew, key) => {
+      const bufferIndex = interactionIndex.get(key);
+      if (bufferIndex === undefined) return;
+      const storedIndex = mergedIndex.get(key);
+      if (storedIndex !== undefined) {
+        merged[storedIndex] = buffer[bufferIndex];
+      } else if (isNew) {
+        mergedIndex.set(key, merged.length);
+        merged.push(buffer[bufferIndex]);
+      }
+      // Otherwise it was already uploaded and cleared, so don't restore it
+    });
+    localStorage.setItem(LOCAL_STORAGE_KEY, JSON.stringify(merged));
+    pendingInteractionKeys.clear();
+    setInteractionBuffer(merged);
+    debugLog("Interactions flushed to localStorage", {
+      count: merged.length,
+    });
+  } catch (error) {
+    debugLog("ERROR flushing interactions to localStorage", error);
+  }
+};
+
+// Pending idle flush, if one has been scheduled
+let pendingFlushHandle: number | null = null;
+
+// Queues a flush for when the browser is idle so serializing the log never
+// competes with the response animation. Repeated calls coalesce into one write.
+const scheduleInteractionFlush = () => {
+  if (pendingFlushHandle !== null) return;
+  const runFlush = () => {
+    pendingFlushHandle = null;
+    flushStoredInteractions();
+  };
+  pendingFlushHandle =
+    typeof window.requestIdleCallback === "function"
+      ? window.requestIdleCallback(runFlush, { timeout: 2000 })
+      : window.setTimeout(runFlush, 0);
+};
+
+if (typeof window !== "undefined") {
+  // Make sure buffered interactions survive the tab being closed or reloaded
+  window.addEventListener("pagehide", flushStoredInteractions);
+  // Another tab changed the stored log: write this tab's pending changes on
+  // top of its version, then reload from localStorage on next use
+  window.addEventListener("storage", (event) => {
+    if (event.key !== LOCAL_STORAGE_KEY && event.key !== null) return;
+    flushStoredInteractions();
+    if (pendingInteractionKeys.size === 0) {
+      interactionBuffer = null;
+      interactionIndex.clear();
+    }
+  });
+}
+
 // Track user interaction
 export const trackUserInteraction = async (data: InteractionData) => {
   const interactionToStore: InteractionData = {
@@ -78,20 +197,16 @@ export const trackUserInteraction = async (data: InteractionData) => {
   });
   try {
     if (typeof window === "undefined" || !window.localStorage) return;
-    const storedData = localStorage.getItem(LOCAL_STORAGE_KEY);
-    const interactions: InteractionData[] = storedData
-      ? JSON.parse(storedData)
-      : [];
-    if (
-      !interactions.some(
-        (i) =>
-          i.deviceId === interactionToStore.deviceId &&
-          i.timestamp === interactionToStore.timestamp
-      )
-    ) {
+    const interactions = getBufferedInteractions();
+    const key = getInteractionKey(
+      interactionToStore.deviceId,
+      interactionToStore.timestamp
+    );
+    if (!interactionIndex.has(key)) {
+      interactionIndex.set(key, interactions.length);
       interactions.push(interactionToStore);
-      localStorage.setItem(LOCAL_STORAGE_KEY, JSON.stringify(interactions));
-      debugLog("Interaction stored locally successfully", {
+      markInteractionPending(key, true);
+      debugLog("Interaction buffered successfully", {
         newCount: interactions.length,
       });
       if (
@@ -123,27 +238,27 @@ export const updateInteraction = async (
   });
   try {
     if (typeof window === "undefined" || !window.localStorage) return;
-    const storedData = localStorage.getItem(LOCAL_STORAGE_KEY);
-    if (!storedData) return;
-    const interactions: InteractionData[] = JSON.parse(storedData);
-    const interactionIndex = interactions.findIndex(
-      (i) => i.deviceId === deviceId && i.timestamp === timestamp
-    );
-    if (interactionIndex === -1) {
+    const interactions = getBufferedInteractions();
+    const key = getInteractionKey(deviceId, timestamp);
+    const bufferIndex = interactionIndex.get(key);
+    if (bufferIndex === undefined) {
       debugLog("Interaction not found for update", { deviceId, timestamp });
       return;
     }
-    interactions[interactionIndex].response = response;
-    if (puzzleContext) {
-      interactions[interactionIndex].puzzleContext = puzzleContext;
-      // Update summary if this update confirms puzzle success or first encounter
-      if (puzzleContext.isSolutionSuccess || puzzleContext.activePuzzleId) {
-        await updateSessionPuzzleSummary(interactions[interactionIndex]);
-      }
+    const interaction = interactions[bufferIndex];
+    interaction.response = response;
+    if (puzzleContext) interaction.puzzleContext = puzzleContext;
+    // Mark before awaiting, so a flush in between picks the change up
+    markInteractionPending(key, false);
+    // Update summary if this update confirms puzzle success or first encounter
+    if (
+      puzzleContext &&
+      (puzzleContext.isSolutionSuccess || puzzleContext.activePuzzleId)
+    ) {
+      await updateSessionPuzzleSummary(interaction);
     }
-    localStorage.setItem(LOCAL_STORAGE_KEY, JSON.stringify(interactions));
     debugLog("Interaction updated successfully in localStorage", {
-      index: interactionIndex,
+      index: bufferIndex,
     });
   } catch (error) {
     debugLog("ERROR updating interaction", error);
@@ -198,11 +313,8 @@ const updateSessionPuzzleSummary = async (interactionData: InteractionData) => {
     // --- FIX: Use correct interface field ---
     // Set first encounter time if not already set and if we don't have it yet
     if (!puzzleAttempt.firstEncounterTime) {
-      const storedInteractionsRaw = localStorage.getItem(LOCAL_STORAGE_KEY);
-      if (storedInteractionsRaw) {
-        const interactions: InteractionData[] = JSON.parse(
-          storedInteractionsRaw
-        );
+      const interactions = getBufferedInteractions();
+      if (interactions.length > 0) {
         const firstInteraction = interactions
           .filter((i) => i.puzzleContext?.activePuzzleId === puzzleId)
           .sort((a, b) => a.timestamp - b.timestamp)[0]; // Find the earliest
@@ -239,6 +351,7 @@ const updateSessionPuzzleSummary = async (interactionData: InteractionData) => {
 type PuzzleStatsIntermediate = Partial<PuzzleAttemptSummary> & {
   interactions: InteractionData[];
   totalHesitationDuration?: number; // Add the missing field here
+  solvedTimestamp?: number; // Raw epoch ms, converted to solvedTime once at the end
 };
 // --- END TYPE FIX ---
 
@@ -247,10 +360,9 @@ export const generateSessionAnalysis = async (): Promise<string | null> => {
   debugLog("Generating session analysis from localStorage data...");
   try {
     if (typeof window === "undefined" || !window.localStorage) return null;
-    const storedData = localStorage.getItem(LOCAL_STORAGE_KEY);
     const summaryData = localStorage.getItem(SESSION_SUMMARY_KEY);
-    if (!storedData || !summaryData) return null;
-    const interactions: InteractionData[] = JSON.parse(storedData);
+    if (!summaryData) return null;
+    const interactions = getBufferedInteractions();
     const summary: SessionSummary = JSON.parse(summaryData);
     if (interactions.length === 0) return null;
 
@@ -300,7 +412,7 @@ export const generateSessionAnalysis = async (): Promise<string | null> => {
         // --- END FIX ---
         if (interaction.puzzleContext?.isSolutionSuccess) {
           stats.solutionFound = true;
-          stats.solvedTime = new Date(interaction.timestamp);
+          stats.solvedTimestamp = interaction.timestamp;
         }
       }
     });
@@ -315,9 +427,9 @@ export const generateSessionAnalysis = async (): Promise<string | null> => {
       const firstInteractionTime = new Date(firstInteraction.timestamp);
       // --- END FIX ---
       let timeToSolutionMs: number | undefined = undefined;
-      if (stats.solutionFound && stats.solvedTime) {
-        timeToSolutionMs =
-          stats.solvedTime.getTime() - firstInteractionTime.getTime();
+      if (stats.solutionFound && stats.solvedTimestamp !== undefined) {
+        // Plain epoch-ms subtraction, no Date round-trip
+        timeToSolutionMs = stats.solvedTimestamp - firstInteraction.timestamp;
       }
       return {
         puzzleId: stats.puzzleId!,
@@ -337,7 +449,10 @@ export const generateSessionAnalysis = async (): Promise<string | null> => {
         // --- FIX: Use correct field name for assignment ---
         firstEncounterTime: firstInteractionTime,
         // --- END FIX ---
-        solvedTime: stats.solvedTime,
+        solvedTime:
+          stats.solvedTimestamp !== undefined
+            ? new Date(stats.solvedTimestamp)
+            : undefined,
       };
     });
 
@@ -383,6 +498,7 @@ export const uploadStoredInteractions = async (): Promise<boolean> => {
   try {
     if (typeof window === "undefined" || !window.localStorage) return false;
     await generateSessionAnalysis(); // Update summary before upload
+    flushStoredInteractions();
     const storedInteractions = localStorage.getItem(LOCAL_STORAGE_KEY);
     const storedSummary = localStorage.getItem(SESSION_SUMMARY_KEY);
     if (!storedInteractions && !storedSummary) return true;
@@ -407,6 +523,9 @@ export const uploadStoredInteractions = async (): Promise<boolean> => {
       debugLog("Upload successful", result);
       localStorage.removeItem(LOCAL_STORAGE_KEY);
       localStorage.removeItem(SESSION_SUMMARY_KEY);
+      interactionBuffer = null;
+      interactionIndex.clear();
+      pendingInteractionKeys.clear();
       debugLog("localStorage cleared after successful upload.");
       return true;
     } else {
@@ -536,7 +655,7 @@ const calculateFunctionalFixednessMetrics = (
       // --- END FIX ---
       if (interaction.puzzleContext?.isSolutionSuccess) {
         stats.solutionFound = true;
-        stats.solvedTime = new Date(interaction.timestamp);
+        stats.solvedTimestamp = interaction.timestamp;
       }
     }
   });
@@ -547,9 +666,9 @@ const calculateFunctionalFixednessMetrics = (
     );
     const firstInteractionTime = new Date(firstInteraction.timestamp);
     let timeToSolutionMs: number | undefined = undefined;
-    if (stats.solutionFound && stats.solvedTime) {
-      timeToSolutionMs =
-        stats.solvedTime.getTime() - firstInteractionTime.getTime();
+    if (stats.solutionFound && stats.solvedTimestamp !== undefined) {
+      // Plain epoch-ms subtraction, no Date round-trip
+      timeToSolutionMs = stats.solvedTimestamp - firstInteraction.timestamp;
     }
     return {
       puzzleId: stats.puzzleId!,
@@ -569,7 +688,10 @@ const calculateFunctionalFixednessMetrics = (
       // --- FIX: Use correct field name for assignment ---
       firstEncounterTime: firstInteractionTime, // Assuming PuzzleAttemptSummary has this
       // --- END FIX ---
-      solvedTime: stats.solvedTime,
+      solvedTime:
+        stats.solvedTimestamp !== undefined
+          ? new Date(stats.solvedTimestamp)
+          : undefined,
     };
   });
 };
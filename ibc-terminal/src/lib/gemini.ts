@@ -231,6 +231,21 @@ INITIAL RESPONSE REQUIREMENT (Your Very First Message):
 `;
 };
 
+// The system prompt only depends on static world config, so build each
+// world/variant pair once per server instance instead of on every command
+const systemPromptCache = new Map<string, string>();
+
+const getCachedSystemPrompt = (worldId: number, variant: "A" | "B"): string => {
+  const cacheKey = `${worldId}:${variant}`;
+  let systemPrompt = systemPromptCache.get(cacheKey);
+  if (systemPrompt === undefined) {
+    debugLog("Building system prompt", { worldId, variant });
+    systemPrompt = getSystemPrompt(worldId, variant);
+    systemPromptCache.set(cacheKey, systemPrompt);
+  }
+  return systemPrompt;
+};
+
 /**
  * Gets a response from Gemini for a user command and session context.
  * Uses the original ai.chats.create API pattern.
@@ -248,11 +263,9 @@ export const getGeminiResponse = async (
     // Initialize client using the original import name
     const ai: GoogleGenAI = initializeGemini();
 
-    // Get world data using the imported function
-    const worldData: WorldDefinition = getWorldData(worldId);
-
-    // Generate the system prompt using the updated logic
-    const systemInstruction = getSystemPrompt(worldId, variant);
+    // Generate the system prompt using the updated logic (world data is only
+    // looked up on a cache miss, or by the fallback below if the call fails)
+    const systemInstruction = getCachedSystemPrompt(worldId, variant);
 
     // Convert history roles for the API
     const convertedHistory = history.map((message) => ({
@@ -413,7 +426,7 @@ export const getWorldIntroduction = async (
     });
 
     // Generate the system prompt with specific introduction instructions appended
-    const baseSystemPrompt = getSystemPrompt(worldId, variant);
+    const baseSystemPrompt = getCachedSystemPrompt(worldId, variant);
     const introRequirements = `
 
 FINAL CRITICAL INSTRUCTIONS FOR THIS **INTRODUCTION ONLY**:
@@ -120,21 +120,21 @@ export const getOrCreateSession = async (
 };
 
 /**
- * Appends a message to the session's conversation history.
+ * Appends messages to the session's conversation history in a single update.
  * @param db - MongoDB Db instance
  * @param sessionId - The ObjectId of the session
- * @param message - The message object { role: 'user'|'model', parts: [{ text: string }] }
+ * @param messages - Message objects { role: 'user'|'model', parts: [{ text: string }] }, in order
  */
 export const updateSessionHistory = async (
   db: Db, // Use Db type
   sessionId: ObjectId,
-  message: { role: "user" | "model"; parts: { text: string }[] } // Use specific roles
+  messages: { role: "user" | "model"; parts: { text: string }[] }[] // Use specific roles
 ): Promise<void> => {
   const result = await db.collection<SessionData>("sessions").updateOne(
     { _id: sessionId },
     {
-      // Use $push correctly typed for the history array
-      $push: { history: message },
+      // Use $push with $each so a whole turn is written in one round trip
+      $push: { history: { $each: messages } },
       $set: { lastActiveTime: new Date() },
     }
   );
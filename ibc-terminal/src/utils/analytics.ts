@@ -76,14 +76,13 @@ const identifyKeystrokePatterns = (
 ): string[] => {
   if (keystrokes.length < 3) return [];
 
-  // Extract just the keys
-  const keys = keystrokes.map((k) => k.key);
-
   // Simple n-gram analysis for common 3-character sequences
   const trigrams: Record<string, number> = {};
 
-  for (let i = 0; i < keys.length - 2; i++) {
-    const trigram = keys.slice(i, i + 3).join("");
+  for (let i = 0; i < keystrokes.length - 2; i++) {
+    // Concatenate the keys directly rather than slicing and joining an array
+    const trigram =
+      keystrokes[i].key + keystrokes[i + 1].key + keystrokes[i + 2].key;
     trigrams[trigram] = (trigrams[trigram] || 0) + 1;
   }
 
@@ -9,6 +9,9 @@
  * - parseCommand: Parses user input into command and arguments
  * - formatTerminalText: Formats text with terminal color styling
  * - processSpecialCommands: Handles non-AI terminal commands (clear, debug, etc.)
+ * - preloadSound: Warms a pooled player for a sound effect ahead of first use
+ * - getLoopingSound: Takes a looping sound player from the pool for one caller
+ * - releaseLoopingSound: Stops a sound player and returns it to the pool
  */
 
 // Terminal utility functions
@@ -39,6 +42,56 @@ export const typewriterEffect = (
   });
 };
 
+// Idle sound players keyed by source path. Each caller takes its own player
+// and hands it back when done, so overlapping uses never share an element and
+// a file is only loaded once per player rather than once per use.
+const soundPools = new Map<string, HTMLAudioElement[]>();
+
+/**
+ * Makes sure an idle player exists for a sound effect, so the first use
+ * doesn't wait on the download.
+ * @param src - Public path of the audio file
+ */
+export const preloadSound = (src: string): void => {
+  if (soundPools.get(src)?.length) return;
+  const sound = new Audio(src);
+  sound.loop = true;
+  sound.preload = "auto";
+  soundPools.set(src, [sound]);
+};
+
+/**
+ * Takes a looping player for a sound effect from the pool, creating one if
+ * none is idle. The caller owns it until it calls releaseLoopingSound.
+ * @param src - Public path of the audio file
+ * @returns A looping HTMLAudioElement for the caller's exclusive use
+ */
+export const getLoopingSound = (src: string): HTMLAudioElement => {
+  const sound = soundPools.get(src)?.pop() || new Audio(src);
+  sound.loop = true;
+  sound.preload = "auto";
+  return sound;
+};
+
+/**
+ * Stops and rewinds a player from getLoopingSound and returns it to the pool.
+ * The caller must not use it afterwards.
+ * @param sound - The player to release
+ */
+export const releaseLoopingSound = (sound: HTMLAudioElement): void => {
+  sound.pause();
+  sound.currentTime = 0;
+  // The src attribute holds the original path the player was created with
+  const src = sound.getAttribute("src");
+  if (!src) return;
+  const idle = soundPools.get(src);
+  if (idle) {
+    idle.push(sound);
+  } else {
+    soundPools.set(src, [sound]);
+  }
+};
+
 /**
  * Parses a user input string into a command and argument array.
  * @param input - The raw user input